@@ -15,6 +15,8 @@ SERVER = "127.0.0.1"
 PORT = 6667
 SERVER_PASSWORD: Optional[str] = None
 
+logger= Logger(file_path= "log.txt", min_level= 0)
+
 @Bot.on_ready()
 async def initialization_setup(bot: Bot):
     """
@@ -35,9 +37,6 @@ async def initialization_setup(bot: Bot):
 async def run_bot():
     """Main entry point to initialize and run the bot."""
 
-    global logger
-    logger= Logger(file_path= "log.txt", min_level= 0)
-
     irc_connection = IRCConnection(SERVER, PORT, logger, quit_msg= "nIRC is shutting down...")
 
     bot = Bot(
@@ -8,18 +8,22 @@ async def ai_query_command(ctx: Context):
     """
     if ctx.arg:
         await ctx.reply("Processing...")
+        send = ctx.send
         model = "nekko:latest" # My private custom model, change this to something else like gemma3:latest
         prompt = ctx.arg
-        current_line_buffer = ""
+        line_buffer = []
         response_stream = ollama.generate(model=model, prompt=prompt, stream=True)
         for chunk in response_stream:
-            if 'response' in chunk:
-                current_line_buffer += chunk['response']
-                if '\n' in current_line_buffer:
-                    lines_to_send = current_line_buffer.split('\n')
-                    current_line_buffer = lines_to_send.pop()
-                    for line in lines_to_send:
-                        if line.strip():
-                            await ctx.send(line)
+            piece = chunk.get('response')
+            if not piece:
+                continue
+            line_buffer.append(piece)
+            if '\n' in piece:
+                to_send, _, tail = ''.join(line_buffer).rpartition('\n')
+                line_buffer = [tail] if tail else []
+                for line in to_send.split('\n'):
+                    if line.strip():
+                        await send(line)
+        current_line_buffer = ''.join(line_buffer)
         if current_line_buffer.strip():
-            await ctx.send(current_line_buffer)
+            await send(current_line_buffer)
@@ -2,7 +2,6 @@ from nIRC.irc import Bot, Context
 from nIRC.permissions import Permissions, perm_remove_user_on_leave
 
 perm_list= {
-        'nekomimi': 100,
         'NekoMimi': 100,
         'disuser': 20
 }
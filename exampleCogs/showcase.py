@@ -1,26 +1,32 @@
 import io
-import sys
 from nIRC.irc import Bot, Context, DCCFile, Member
 from nIRC.permissions import Permissions, perm_remove_user_on_leave
 import ast
+import asyncio
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Iterable
 
 perm_list= {
-        'nekomimi': 100,
         'NekoMimi': 100,
         'disuser': 20
 }
 
+_FAIL_MSGS= {
+    1: "You are not on the whitelist.",
+    2: "You are not registered, run the following to login:\n/msg {nick} identify PASSWORD",
+    3: "You lack the necessary authority level to run this command"
+}
+
 async def fail_callback(ctx: Context, err_no: int):
-    if err_no== 1:
-        await ctx.send("You are not on the whitelist.")
-    if err_no== 2:
-        await ctx.send("You are not registered, run the following to login:")
-        await ctx.send(f"/msg {ctx.bot.nick} identify PASSWORD")
-    if err_no== 3:
-        await ctx.send("You lack the necessary authority level to run this command")
+    msg= _FAIL_MSGS.get(err_no)
+    if msg:
+        await ctx.send(msg.format(nick= ctx.bot.nick) if err_no== 2 else msg)
 
 perms= Permissions(perm_list, fail_callback)
 
+_MISSING= object()
+
 @Bot.prefix_command("identify ")
 async def cmd_login(ctx: Context):
     """Identify to get added to registered users (still doesn't allow safeguard commands unless on whitelist)"""
@@ -50,12 +56,15 @@ async def hello_from_cog(ctx: Context):
 async def cog_task(bot_instance: Bot):
     """A recurring task loaded from a cog."""
 
-    current = getattr(cog_task, 'current_repeat', 0)
-    total = getattr(cog_task, 'max_repeat', 0)
+    try:
+        current = cog_task.current_repeat #type: ignore
+        total = cog_task.max_repeat #type: ignore
+    except AttributeError:
+        current = total = 0
 
     bot_instance.logger.info("TASK", f"[COG] Cog task is running! Repeat {current}/{total}")
-    for channel in bot_instance.channel_map:
-        await bot_instance.send_message(channel, f"Cog task reporting in! (Run {current}/{total})")
+    msg = f"Cog task reporting in! (Run {current}/{total})"
+    await asyncio.gather(*(bot_instance.send_message(channel, msg) for channel in bot_instance.channel_map))
 
 @Bot.command("tasker")
 @perms.safeguard(90)
@@ -74,6 +83,42 @@ async def cog_task_runner(ctx: Context):
     except Exception as e:
         await ctx.reply(f"Failed to run task: {e}")
 
+def _split_utf8(line: str, budget: int):
+    """Yields (piece, byte_size) chunks of line that each encode to at most budget bytes, never splitting a character"""
+    data= line.encode()
+    while len(data) > budget:
+        cut= budget
+        while cut and (data[cut] & 0xC0) == 0x80: # continuation byte, back up to the start of the character
+            cut-= 1
+        yield data[:cut].decode(), cut
+        data= data[cut:]
+    yield data.decode(), len(data)
+
+async def send_batched(ctx: Context, lines: Iterable[str], limit: int = 400, sep: str = " | "):
+    """Sends lines joined by sep, packing as many as fit in limit encoded bytes per IRC message (PRIVMSG <target> : included)"""
+    recipient= ctx.author if ctx.target == ctx.bot.nick else ctx.target
+    budget= max(limit- len(f"PRIVMSG {recipient} :".encode()), 4)
+    sep_size= len(sep.encode())
+
+    buf= []
+    size= 0
+    for line in lines:
+        for piece, piece_size in _split_utf8(line, budget):
+            if buf and size+ sep_size+ piece_size > budget:
+                await ctx.send(sep.join(buf))
+                buf= []
+                size= 0
+            size+= piece_size+ (sep_size if buf else 0)
+            buf.append(piece)
+    if buf:
+        await ctx.send(sep.join(buf))
+
+def _eval_segments(text: str):
+    for line in text.splitlines():
+        line= line.strip()
+        if line:
+            yield from split_by_nth_length(line, 300)
+
 @Bot.command("rmcmd")
 @perms.safeguard(90)
 async def cog_rm_cmd(ctx: Context):
@@ -83,15 +128,9 @@ async def cog_rm_cmd(ctx: Context):
         await ctx.reply("Usage: !rmcmd <command_name>")
         return
     
-    removed= False
     cmd_name= ctx.arg
-    old_reg= ctx.bot.commands.copy()
-    ctx.bot.commands.clear()
-    for cmd, func in old_reg.items():
-        if not cmd == cmd_name:
-            ctx.bot.commands[cmd]= func # Note: this will most likely break on a cog unload due to the main _event_registry remaining intact
-        else:
-            removed= True
+    # Note: this will most likely break on a cog unload due to the main _event_registry remaining intact
+    removed= ctx.bot.commands.pop(cmd_name, _MISSING) is not _MISSING
 
     if removed:
         await ctx.reply(f"Removed command: '{cmd_name}'.")
@@ -102,48 +141,38 @@ async def cog_rm_cmd(ctx: Context):
 async def loaded_commands(ctx: Context):
     """Shows what commands you have loaded"""
 
-    coms= ""
-    pcoms= ""
-    events= ""
-    tasks= ""
-
-    for com in ctx.bot.commands:
-        coms+= str(com)+ " "
-
-    for pcom in ctx.bot.prefix_commands:
-        pcoms+= str(pcom)+ " "
-
-    for event in ctx.bot.event_handlers:
-        events+= str(event)+ f"({len(ctx.bot.event_handlers[event])}) "
-
-    for task in ctx.bot.task_registry:
-        tasks+= str(task)+ " "
+    bot= ctx.bot
+    coms= " ".join(map(str, bot.commands))
+    pcoms= " ".join(map(str, bot.prefix_commands))
+    events= " ".join(f"{event}({len(handlers)})" for event, handlers in bot.event_handlers.items())
+    tasks= " ".join(map(str, bot.task_registry))
 
     await ctx.send("===Registered Events=======================================")
-    await ctx.send(f"Commands: {coms}")
-    await ctx.send(f"Prefix Commands: {pcoms}")
-    await ctx.send(f"Events: {events}")
-    await ctx.send(f"Tasks: {tasks}")
+    await send_batched(ctx, (f"Commands: {coms}", f"Prefix Commands: {pcoms}", f"Events: {events}", f"Tasks: {tasks}"))
     await ctx.send("===========================================================")
 
 @Bot.prefix_command("n+ ")
 @perms.safeguard(90)
 async def allow_users(ctx: Context):
-    if not len(ctx.args) == 2:
+    args= ctx.args
+    if not len(args) == 2:
         await ctx.send(f"Invalid syntax: n+ NICK LVL")
         return
-    perms.add_user(ctx.args[0])
-    perms.add_perm(ctx.args[0], int(ctx.args[1]))
-    await ctx.send(f"Gave '{ctx.args[0]}' an authority level of '{ctx.args[1]}'")
+    nick, lvl= args
+    perms.add_user(nick)
+    perms.add_perm(nick, int(lvl))
+    await ctx.send(f"Gave '{nick}' an authority level of '{lvl}'")
 
 @Bot.prefix_command("n- ")
 @perms.safeguard(90)
 async def remove_users(ctx: Context):
-    if not len(ctx.args) == 1:
+    args= ctx.args
+    if not len(args) == 1:
         await ctx.send(f"Invalid syntax: n- NICK")
         return
-    perms.rm_perm(ctx.args[0])
-    await ctx.send(f"Removed '{ctx.args[0]}' from Whitelist")
+    nick= args[0]
+    perms.rm_perm(nick)
+    await ctx.send(f"Removed '{nick}' from Whitelist")
 
 @Bot.command("whitelist")
 @perms.safeguard(50)
@@ -151,8 +180,7 @@ async def view_wl(ctx: Context):
     """Shows whitelist"""
 
     await ctx.send("==Whitelist===========")
-    for name, lvl in perms.perm_list.items():
-        await ctx.send(f"[{name}] @ {lvl}")
+    await send_batched(ctx, (f"[{name}] @ {lvl}" for name, lvl in perms.perm_list.items()))
     await ctx.send("======================")
 
 @Bot.command("reglist")
@@ -161,8 +189,7 @@ async def view_ru(ctx: Context):
     """Shows registered users"""
 
     await ctx.send("==Registered=Users====")
-    for name in perms.registered_users:
-        await ctx.send(f"[{name}]")
+    await send_batched(ctx, (f"[{name}]" for name in perms.registered_users))
     await ctx.send("======================")
 
 @Bot.prefix_command(">>")
@@ -182,71 +209,72 @@ async def ai_query_command(ctx: Context):
         await ctx.reply("Please provide a query after the '>>'.")
 
 def insert_returns(body):
-    if isinstance(body[-1], ast.Expr):
-        body[-1] = ast.Return(body[-1].value)
-        ast.fix_missing_locations(body[-1])
+    stack = [body]
+    while stack:
+        body = stack.pop()
+        if not body:
+            continue
+        last = body[-1]
+        if isinstance(last, ast.Expr):
+            body[-1] = ast.Return(last.value)
+            ast.fix_missing_locations(body[-1])
+        elif isinstance(last, ast.If):
+            stack.append(last.body)
+            stack.append(last.orelse)
+        elif isinstance(last, ast.With):
+            stack.append(last.body)
+
+_EVAL_FN= "_eval_expr"
+
+@lru_cache(maxsize=128)
+def _compile_eval(cmd: str):
+    """Wraps an eval snippet in an async function and compiles it, cached by source text"""
 
-    if isinstance(body[-1], ast.If):
-        insert_returns(body[-1].body)
-        insert_returns(body[-1].orelse)
+    cmd = cmd.strip("` ")
+    cmd = "\n".join(f"    {i}" for i in cmd.splitlines())
+    body = f"async def {_EVAL_FN}():\n{cmd}"
 
-    if isinstance(body[-1], ast.With):
-        insert_returns(body[-1].body)
+    parsed = ast.parse(body)
+    insert_returns(parsed.body[0].body) #type: ignore
+    return compile(parsed, filename="<ast>", mode="exec")
 
 def split_by_nth_length(text, n):
-    chunks = []
     for i in range(0, len(text), n):
-        chunks.append(text[i:i + n])
-    return chunks
+        yield text[i:i + n]
 
 @Bot.command("eval")
 @perms.safeguard(90)
 async def eval_fn(ctx: Context):
     """You most likely do NOT want to use this on a public server"""
 
-    fn_name = "_eval_expr"
-
-    cmd= ctx.arg
-    cmd = cmd.strip("` ")
-    cmd = "\n".join(f"    {i}" for i in cmd.splitlines())
-    body = f"async def {fn_name}():\n{cmd}"
-
-    parsed = ast.parse(body)
-    body = parsed.body[0].body #type: ignore
-    insert_returns(body)
+    code = _compile_eval(ctx.arg)
+    captured_output = io.StringIO()
 
+    # print() inside the snippet writes to this eval's buffer; sys.stdout is never swapped, so
+    # concurrent log output and other handlers' prints can't end up in the reply
     env = {
         'bot': ctx.bot,
         'ctx': ctx,
+        'print': partial(print, file=captured_output),
         '__import__': __import__
     }
-    exec(compile(parsed, filename="<ast>", mode="exec"), env)
-    original_output = sys.stdout
-    captured_output = io.StringIO()
-
-    sys.stdout = captured_output
+    exec(code, env)
 
+    error = None
     try:
-        result = str(await eval(f"{fn_name}()", env))
+        result = str(await env[_EVAL_FN]())
     except Exception as e:
-        await ctx.send("Failed to eval: "+ str(e))
+        error = e
+    if error is not None:
+        await ctx.send("Failed to eval: "+ str(error))
         return
     captured_result = captured_output.getvalue()
-    sys.stdout = original_output
 
     await ctx.send("==Eval Result=========")
-    for line in result.splitlines():
-        line= line.strip()
-        if line and not line == "":
-            for seg in split_by_nth_length(line, 300):
-                await ctx.send(seg)
+    await send_batched(ctx, _eval_segments(result))
 
     await ctx.send("==STDOUT==============")
-    for line in captured_result.splitlines():
-        line= line.strip()
-        if line and not line == "":
-            for seg in split_by_nth_length(line, 300):
-                await ctx.send(seg)
+    await send_batched(ctx, _eval_segments(captured_result))
 
 @Bot.command("shutdown")
 @perms.safeguard(90)
@@ -254,6 +282,30 @@ async def cog_shutdown(ctx: Context):
     ctx.bot.running= False
     return
 
+async def _mod_kick(ctx: Context, target: str, subject: str, value: str):
+    await ctx.get_member(subject).kick(target, value)
+    await ctx.reply(f"Attempted to kick {subject} from {target}.")
+
+async def _mod_ban(ctx: Context, target: str, subject: str, value: str):
+    await ctx.get_member(subject).ban(target, value)
+    await ctx.reply(f"Attempted to ban and kick {subject} from {target}.")
+
+async def _mod_topic(ctx: Context, target: str, subject: str, value: str):
+    await ctx.channel_obj.set_topic(value)
+    await ctx.reply(f"New topic set to: {value}")
+
+async def _mod_unban(ctx: Context, target: str, subject: str, value: str):
+    await ctx.channel_obj.unban(subject)
+    await ctx.reply(f"Attempted to remove ban mask: {subject}")
+
+# action: (handler, only valid in a channel)
+_MOD_ACTIONS= {
+    "kick": (_mod_kick, False),
+    "ban": (_mod_ban, False),
+    "topic": (_mod_topic, True),
+    "unban": (_mod_unban, True),
+}
+
 @Bot.command("mod")
 @perms.safeguard(50)
 async def mod_command(ctx: Context):
@@ -262,32 +314,20 @@ async def mod_command(ctx: Context):
     Usage: !mod <action> <target> [reason/value]
     """
 
-    if len(ctx.args) < 2:
+    args = ctx.args
+    if len(args) < 2:
         await ctx.reply("Usage: !mod <kick|ban|topic|unban> <target> [value]")
         return
 
-    action = ctx.args[0].lower()
-    target_nick_or_mask = ctx.args[1]
-    value_or_reason = " ".join(ctx.args[2:]) or "No reason provided."
-
-    if action == "kick":
-        member = ctx.get_member(target_nick_or_mask)
-        await member.kick(ctx.target, value_or_reason)
-        await ctx.reply(f"Attempted to kick {target_nick_or_mask} from {ctx.target}.")
-
-    elif action == "ban":
-        member = ctx.get_member(target_nick_or_mask)
-        await member.ban(ctx.target, value_or_reason)
-        await ctx.reply(f"Attempted to ban and kick {target_nick_or_mask} from {ctx.target}.")
-
-    elif action == "topic" and ctx.target.startswith('#'):
-        await ctx.channel_obj.set_topic(value_or_reason)
-        await ctx.reply(f"New topic set to: {value_or_reason}")
-
-    elif action == "unban" and ctx.target.startswith('#'):
-        await ctx.channel_obj.unban(target_nick_or_mask)
-        await ctx.reply(f"Attempted to remove ban mask: {target_nick_or_mask}")
+    action = args[0]
+    target = ctx.target
+    target_nick_or_mask = args[1]
+    value_or_reason = " ".join(islice(args, 2, None)) or "No reason provided."
 
+    # Actions are usually typed lowercase already, only fold when the exact lookup misses
+    handler, channel_only = _MOD_ACTIONS.get(action) or _MOD_ACTIONS.get(action.casefold(), (None, False))
+    if handler and (not channel_only or target.startswith('#')):
+        await handler(ctx, target, target_nick_or_mask, value_or_reason)
     else:
         await ctx.reply(f"Unknown moderation action: {action}. Use kick, ban, topic, or unban.")
 
@@ -295,41 +335,44 @@ async def mod_command(ctx: Context):
 async def pm_user_command(ctx: Context):
     """Sends a private message to a specified user."""
 
-    if len(ctx.args) < 2:
+    args = ctx.args
+    if len(args) < 2:
         await ctx.reply("Usage: !pmuser <nick> <message...>")
         return
 
-    recipient_nick = ctx.args[0]
-    message_text = " ".join(ctx.args[1:])
+    recipient_nick = args[0]
+    message_text = " ".join(islice(args, 1, None))
 
-    await ctx.bot.send_message(recipient_nick, f"PM from {ctx.author}: {message_text}")
-    await ctx.reply(f"PM sent to {recipient_nick}.")
+    await asyncio.gather(
+        ctx.bot.send_message(recipient_nick, f"PM from {ctx.author}: {message_text}"),
+        ctx.reply(f"PM sent to {recipient_nick}.")
+    )
 
 @Bot.on_message()
 async def keyword_responder(ctx: Context):
     """Responds to specific keywords in a channel message."""
 
-    message = ctx.message.lower()
-    if message.strip() == ctx.bot.nick.lower():
+    message = ctx.message.strip()
+    nick_lower = ctx.bot.nick_lower
+    if len(message) == len(nick_lower) and message.lower() == nick_lower:
         await ctx.reply(f"My command prefix is '{ctx.bot.prefix}'.")
-        coms= ""
-        for com in ctx.bot.commands:
-            coms+= ctx.bot.prefix+ str(com)+ " "
+        prefix= ctx.bot.prefix
+        coms= " ".join(prefix+ str(com) for com in ctx.bot.commands)
         await ctx.send(f"Available commands: {coms}")
 
 @Bot.on_join()
 async def greet_joiner(ctx: Context):
     """Sends a friendly greeting when a new user joins."""
 
-    if ctx.author != ctx.bot.nick:
+    bot_nick = ctx.bot.nick
+    if ctx.author != bot_nick:
         await ctx.reply(f"Welcome, {ctx.author}! Type {ctx.bot.prefix}commands to get a list of commands and events.")
 
-@Bot.on_raw()
+@Bot.on_raw(contains=("ERROR", "NOTICE"))
 async def raw_logger(ctx: Context):
-    """Logs the raw line to the console (for demonstration only, triggers on all lines)."""
+    """Logs the raw line to the console (for demonstration only, triggers on ERROR/NOTICE lines)."""
 
-    if "ERROR" in ctx.full_line or "NOTICE" in ctx.full_line:
-        print(f"[RAW LOG] IMPORTANT LINE: {ctx.full_line}")
+    print(f"[RAW LOG] IMPORTANT LINE: {ctx.full_line}")
 
 @Bot.prefix_command("?")
 async def cog_prefix_cmd(ctx: Context):
@@ -346,66 +389,38 @@ async def get_file(file: DCCFile):
     await user.send("Thanks for the file, it's *definitely* safe :3")
     await file.start_transfer()
 
-@Bot.command("load")
-@perms.safeguard(90)
-async def load_cmd(ctx: Context):
-    if not ctx.arg:
-        await ctx.reply("Usage: !load <cog_name>")
-        return
-
-    cog_name = ctx.arg
-    try:
-        res= ctx.bot.load_cog(cog_name)
-        if res[0]== 0:
-            await ctx.reply(f"Cog '{cog_name}' loaded successfully.")
-        elif res[0]== 1:
-            await ctx.reply(f"Cog '{cog_name}' is already loaded.")
-        else:
-            await ctx.reply(f"Error loading Cog:")
-            for line in str(res[1]).splitlines():
-                await ctx.send(line)
-    except Exception as e:
-        await ctx.reply(f"Error loading cog '{cog_name}': {e}")
-
-@Bot.command("unload")
-@perms.safeguard(90)
-async def unload_cmd(ctx: Context):
-    if not ctx.arg:
-        await ctx.reply("Usage: !unload <cog_name>")
-        return
-
-    cog_name = ctx.arg
-    try:
-        res= ctx.bot.unload_cog(cog_name)
-        if res[0]== 0:
-            await ctx.reply(f"Cog '{cog_name}' unloaded successfully.")
-        elif res[0]== 1:
-            await ctx.reply(f"Cog '{cog_name}' is not loaded.")
-        else:
-            await ctx.reply(f"Error unloading Cog:")
-            for line in str(res[1]).splitlines():
-                await ctx.send(line)
-    except Exception as e:
-        await ctx.reply(f"Error unloading cog '{cog_name}': {e}")
-
-@Bot.command("reload")
-@perms.safeguard(90)
-async def reload_cmd(ctx: Context):
-    if not ctx.arg:
-        await ctx.reply("Usage: !reload <cog_name>")
-        return
-
-    cog_name = ctx.arg
-    try:
-        res= ctx.bot.reload_cog(cog_name)
-        if res[0]== 0:
-            await ctx.reply(f"Cog '{cog_name}' reloaded successfully.")
-        elif res[0]== 1:
-            await ctx.reply(f"Cog '{cog_name}' is not loaded.")
-        else:
-            await ctx.reply(f"Error reloading Cog:")
-            for line in str(res[1]).splitlines():
-                await ctx.send(line)
-    except Exception as e:
-        await ctx.reply(f"Error reloading cog '{cog_name}': {e}")
+_COG_OPS= {
+    "load": ("load_cog", "loaded", "loading", "is already loaded"),
+    "unload": ("unload_cog", "unloaded", "unloading", "is not loaded"),
+    "reload": ("reload_cog", "reloaded", "reloading", "is not loaded"),
+}
 
+def _make_cog_cmd(op: str):
+    """Builds the !load/!unload/!reload handler for one entry of _COG_OPS"""
+
+    method, done, doing, skipped = _COG_OPS[op]
+
+    async def cog_cmd(ctx: Context):
+        if not ctx.arg:
+            await ctx.reply(f"Usage: !{op} <cog_name>")
+            return
+
+        cog_name = ctx.arg
+        try:
+            res= getattr(ctx.bot, method)(cog_name)
+            if res[0]== 0:
+                await ctx.reply(f"Cog '{cog_name}' {done} successfully.")
+            elif res[0]== 1:
+                await ctx.reply(f"Cog '{cog_name}' {skipped}.")
+            else:
+                await ctx.reply(f"Error {doing} Cog:")
+                for line in str(res[1]).splitlines():
+                    await ctx.send(line)
+        except Exception as e:
+            await ctx.reply(f"Error {doing} cog '{cog_name}': {e}")
+
+    cog_cmd.__name__= f"{op}_cmd"
+    return cog_cmd
+
+for _op in _COG_OPS:
+    Bot.command(_op)(perms.safeguard(90)(_make_cog_cmd(_op)))
@@ -1,68 +1,132 @@
-from typing import Dict, Optional, Callable, Any, List, Tuple, Set
+from typing import Dict, Optional, Callable, Any, List, Tuple, Set, Union
 from nIRC.logMessages import *
 from nIRC.logger import Logger, NullLogger, LOG_PREFIX
 from nIRC.types.member import Member
+from nIRC.types.channel import Channel
 from nIRC.types.dcc import DCCFile
 from nIRC.types.context import Context
 from functools import wraps
-import asyncio, re, sys, os
-import importlib
+import asyncio, re, sys, os, socket
+import importlib, weakref
 
 
 _command_registry: Dict[str, Callable] = {}
 _prefix_command_registry: Dict[str, Callable] = {}
-_event_registry: Dict[str, List[Callable]] = {
-    'on_message': [],
-    'on_join': [],
-    'on_leave': [],
-    'on_raw': [],
-    'on_ready': [],
-    'on_nick': [],
-    'on_dcc' : []
+_event_registry: Dict[str, Tuple[Callable, ...]] = {
+    'on_message': (),
+    'on_join': (),
+    'on_leave': (),
+    'on_raw': (),
+    'on_ready': (),
+    'on_nick': (),
+    'on_dcc' : ()
 }
 _task_registry: Dict[str, Callable] = {}
 
-IRC_RE = re.compile(
-    r'^(?:[:](\S+) )?(\S+)(?: (?!:)(.+?))?(?: :(.*))?$'
-)
+# Every decorator stamps its function with the next sequence number, so a cog's
+# registrations are exactly those stamped after its import started.
+_registry_seq = 0
+
+def _stamp(func: Callable) -> Callable:
+    global _registry_seq
+    func._seq = _registry_seq #type: ignore
+    _registry_seq += 1
+    return func
+
+class _PrefixRegistry(dict):
+    """
+    A prefix -> handler dict that counts its own mutations, so the bot knows when its cached prefix pattern is stale.
+    Reads are plain dict reads; every way of changing the dict bumps version.
+    """
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: str, value: Callable):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, Callable]:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self):
+        super().clear()
+        self.version += 1
 
 # PRIVMSG <recipient> :DCC SEND <filename> <ip> <port> <filesize>
+# CTCP commands are uppercase, which lets callers guard the search with a plain substring test
 DCC_SEND_REGEX = re.compile(
-    r"DCC SEND (?P<filename>.+?) (?P<ip>\d+) (?P<port>\d+) (?P<filesize>\d+)",
-    re.IGNORECASE
+    r"DCC SEND (?P<filename>.+?) (?P<ip>\d+) (?P<port>\d+) (?P<filesize>\d+)"
 )
 
+# IRC command -> event fired for it (PRIVMSG is dispatched separately)
+_LINE_EVENTS = {
+    "JOIN": "on_join",
+    "PART": "on_leave",
+    "QUIT": "on_leave",
+    "NICK": "on_nick"
+}
+
+_PONG_PREFIX = b"PONG :"
+_CRLF = b"\r\n"
+
+_OCTETS = tuple(str(i) for i in range(256))
+
 def ip_long_to_dotted(ip_long: int) -> str:
     """
     Converts a long integer IP representation (Network Byte Order/Big Endian)
     to a dotted string (IPv4) without relying on the synchronous 'socket' module.
     """
     # Extract the four octets using bitwise shifts and masks
-    a = (ip_long >> 24) & 0xFF
-    b = (ip_long >> 16) & 0xFF
-    c = (ip_long >> 8) & 0xFF
-    d = ip_long & 0xFF
-    return f"{a}.{b}.{c}.{d}"
+    return ".".join((
+        _OCTETS[(ip_long >> 24) & 0xFF],
+        _OCTETS[(ip_long >> 16) & 0xFF],
+        _OCTETS[(ip_long >> 8) & 0xFF],
+        _OCTETS[ip_long & 0xFF]
+    ))
 
 class IRCConnection:
     """
     Handles the asynchronous socket connection, reading, writing, and buffering
     of raw IRC data using Python's asyncio streams.
     """
-    def __init__(self, host: str, port: int, logger: Optional[Logger] = None, quit_msg: Optional[str] = None):
+    def __init__(self, host: str, port: int, logger: Optional[Logger] = None, quit_msg: Optional[str] = None, read_limit: int = 1 << 20):
         """
         Initializes the connection handler.
         @arg host: The IRC server hostname or IP address.
         @arg port: The IRC server port (usually 6667).
         @kwarg logger: A logger instance for logging network events. If None, NullLogger is used. (default: None)
+        @kwarg quit_msg: The message sent with QUIT when closing. (default: None)
+        @kwarg read_limit: The stream buffer limit in bytes, lines longer than this drop the connection. (default: 1 MiB)
         @return: None
         """
         self.host = host
         self.port = port
+        self.read_limit = read_limit
         self.quit_msg = "QUIT :"+ quit_msg if quit_msg else "QUIT"
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
         self.connected = False
+        self._read_tail = b""
         self.logger: Any = logger if logger is not None else NullLogger()
 
     async def connect(self):
@@ -73,7 +137,11 @@ class IRCConnection:
         """
         try:
             self.logger.info("NET", LOG_NET_ATTEMPT, host=self.host, port=self.port)
-            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, limit=self.read_limit)
+            sock = self.writer.get_extra_info('socket')
+            if sock is not None:
+                # IRC writes are small and latency sensitive (PONG), don't let Nagle hold them back
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.connected = True
             self.logger.info("NET", LOG_NET_ESTABLISHED)
         except ConnectionRefusedError:
@@ -89,14 +157,74 @@ class IRCConnection:
         @arg message: The raw IRC protocol message (e.g., 'PRIVMSG #channel :Hello').
         @return: None
         """
+        if self.queue_raw(message):
+            await self.flush()
+
+    def queue_raw(self, message: str) -> bool:
+        """
+        Buffers a raw IRC message without waiting for it to be written out.
+        Call flush() after queueing a burst of lines.
+        @arg message: The raw IRC protocol message (e.g., 'JOIN #channel').
+        @return: True if the message was queued, False otherwise.
+        """
+        return self.queue_clean(message.strip())
+
+    async def send_clean(self, message: str):
+        """
+        Sends a raw IRC message that is already known to carry no surrounding whitespace, skipping the strip done by send_raw().
+        @arg message: The raw IRC protocol message (e.g., 'MODE #channel -v nick').
+        @return: None
+        """
+        if self.queue_clean(message):
+            await self.flush()
+
+    def queue_clean(self, message: str) -> bool:
+        """
+        Buffers a raw IRC message that is already known to carry no surrounding whitespace, skipping the strip done by queue_raw().
+        Call flush() after queueing a burst of lines.
+        @arg message: The raw IRC protocol message (e.g., 'JOIN #channel').
+        @return: True if the message was queued, False otherwise.
+        """
+        if not self.connected or not self.writer:
+            self.logger.error("ERROR", LOG_ERROR_NOT_CONNECTED)
+            return False
+
+        self.logger.raw_send(message)
+        try:
+            self.writer.write(f"{message}\r\n".encode('utf-8'))
+            return True
+        except Exception as e:
+            self.logger.error("ERROR", LOG_ERROR_SEND_FAIL, error=e)
+            self.connected = False
+            return False
+
+    async def send_pong(self, token: bytes):
+        """
+        Answers a server PING, writing the token back as received without re-encoding it.
+        @arg token: The undecoded PING token.
+        @return: None
+        """
         if not self.connected or not self.writer:
             self.logger.error("ERROR", LOG_ERROR_NOT_CONNECTED)
             return
+        line = _PONG_PREFIX + token
+        self.logger.raw_send(line.decode('utf-8', errors='ignore'))
+        try:
+            self.writer.write(line + _CRLF)
+        except Exception as e:
+            self.logger.error("ERROR", LOG_ERROR_SEND_FAIL, error=e)
+            self.connected = False
+            return
+        await self.flush()
 
-        full_message = f"{message.strip()}\r\n"
-        self.logger.raw_send(full_message.strip())
+    async def flush(self):
+        """
+        Waits until queued messages have been handed to the socket.
+        @return: None
+        """
+        if not self.connected or not self.writer:
+            return
         try:
-            self.writer.write(full_message.encode('utf-8'))
             await self.writer.drain()
         except Exception as e:
             self.logger.error("ERROR", LOG_ERROR_SEND_FAIL, error=e)
@@ -109,18 +237,71 @@ class IRCConnection:
         >>> await bot.conn.read_line()
         'PING :server.irc.net'
         """
+        data = await self.read_raw()
+        if data is None:
+            return None
+        return data.decode('utf-8', errors='ignore')
+
+    async def read_raw(self) -> Optional[bytes]:
+        """
+        Asynchronously reads a single undecoded line from the server.
+        @return: The stripped IRC line as bytes, or None if the connection is closed or an error occurred.
+        >>> await bot.conn.read_raw()
+        b'PING :server.irc.net'
+        """
         if not self.connected or not self.reader:
             return None
 
         try:
             data = await self.reader.readline()
+            if self._read_tail:
+                data, self._read_tail = self._read_tail + data, b""
             if not data:
                 self.logger.info("NET", LOG_NET_CLOSED_REMOTE)
                 self.connected = False
                 return None
 
-            line = data.decode('utf-8', errors='ignore').strip()
-            return line
+            return data.strip()
+
+        except asyncio.CancelledError:
+            return None
+        except Exception as e:
+            self.logger.error("ERROR", LOG_ERROR_READ_FAIL, error=e)
+            self.connected = False
+            return None
+
+    async def read_raw_lines(self) -> Optional[List[bytes]]:
+        """
+        Asynchronously reads every complete line currently available from the server in one go.
+        Waits only when no complete line is buffered yet.
+        @return: A list of stripped, non-empty IRC lines as bytes, or None if the connection is closed or an error occurred.
+        >>> await bot.conn.read_raw_lines()
+        [b'PING :server.irc.net', b':nick!user@host PRIVMSG #chan :hi']
+        """
+        if not self.connected or not self.reader:
+            return None
+
+        try:
+            buf = self._read_tail
+            while True:
+                chunk = await self.reader.read(65536)
+                if not chunk:
+                    self._read_tail = b""
+                    buf = buf.strip()
+                    if buf:
+                        return [buf]
+                    self.logger.info("NET", LOG_NET_CLOSED_REMOTE)
+                    self.connected = False
+                    return None
+
+                buf += chunk
+                if b"\n" in chunk:
+                    break
+                if len(buf) > self.read_limit:
+                    raise ValueError(f"line exceeds the {self.read_limit} byte read limit")
+
+            *lines, self._read_tail = buf.split(b"\n")
+            return [line for line in map(bytes.strip, lines) if line]
 
         except asyncio.CancelledError:
             return None
@@ -165,17 +346,61 @@ class Bot:
         self.registered = False
         self.channel_map: Dict[str, Optional[str]] = {}
         self._mute_status: Dict[str, Set[str]] = {}
+        self._pending_topics: Dict[str, asyncio.Future] = {}
+        self._member_cache: "weakref.WeakValueDictionary[str, Member]" = weakref.WeakValueDictionary()
+        self._channel_cache: "weakref.WeakValueDictionary[str, Channel]" = weakref.WeakValueDictionary()
+        self._tasks: Set[asyncio.Task] = set()
 
         self.conn = conn
         self.logger = conn.logger
         self.save_dir = downloads_dir
 
         self.commands: Dict[str, Callable] = _command_registry.copy()
-        self.prefix_commands: Dict[str, Callable] = _prefix_command_registry.copy()
-        self.event_handlers: Dict[str, List[Callable]] = _event_registry.copy()
+        self.prefix_commands = _prefix_command_registry
+        self.event_handlers: Dict[str, Tuple[Callable, ...]] = _event_registry.copy()
         self.task_registry: Dict[str, Callable] = _task_registry.copy()
 
         self.cogs: Dict[str, Dict[str, Any]] = {}
+        self._prefix_re: Optional[re.Pattern] = None
+        self._prefix_re_key: Optional[Tuple[int, int]] = None
+
+    @property
+    def prefix_commands(self) -> Dict[str, Callable]:
+        """
+        The registered prefix commands (prefix -> handler). Edits to this dict take effect on the next message.
+        @return: The prefix command dict.
+        """
+        return self._prefix_commands
+
+    @prefix_commands.setter
+    def prefix_commands(self, value: Dict[str, Callable]):
+        self._prefix_commands = _PrefixRegistry(value)
+
+    @property
+    def prefix(self) -> str:
+        """
+        The command prefix (e.g., '!').
+        @return: The prefix string.
+        """
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, value: str):
+        self._prefix = value
+        self._prefix_len = len(value)
+
+    @property
+    def nick(self) -> str:
+        """
+        The bot's current nickname.
+        @return: The nickname string.
+        """
+        return self._nick
+
+    @nick.setter
+    def nick(self, value: str):
+        self._nick = sys.intern(value)
+        self.nick_lower = self._nick.lower()
 
     @staticmethod
     def command(name: str):
@@ -189,7 +414,7 @@ class Bot:
         >>>     await ctx.reply("world")
         """
         def decorator(func: Callable):
-            _command_registry[name] = func
+            _command_registry[name] = _stamp(func)
             return func
         return decorator
 
@@ -210,7 +435,7 @@ class Bot:
         def decorator(func: Callable[[Context], Any]):
             if prefix in _prefix_command_registry:
                 print(LOG_PREFIX["CORE"] + LOG_PREFIX_COMMAND_OVERWRITTEN.format(prefix=prefix), file=sys.stderr)
-            _prefix_command_registry[prefix] = func
+            _prefix_command_registry[prefix] = _stamp(func)
 
             @wraps(func)
             def wrapper(*args, **kwargs):
@@ -229,7 +454,7 @@ class Bot:
         >>>     print(f"[{ctx.target}] {ctx.author}: {ctx.message}")
         """
         def decorator(func: Callable):
-            _event_registry['on_message'].append(func)
+            _event_registry['on_message'] += (_stamp(func),)
             return func
         return decorator
 
@@ -242,7 +467,7 @@ class Bot:
         def decorator(func: Callable):
             if not asyncio.iscoroutinefunction(func):
                 raise TypeError("@Bot.on_dcc function must be an async function.")
-            _event_registry['on_dcc'].append(func)
+            _event_registry['on_dcc'] += (_stamp(func),)
             return func
         return decorator
 
@@ -254,7 +479,7 @@ class Bot:
         @return: The decorator function.
         """
         def decorator(func: Callable):
-            _event_registry['on_join'].append(func)
+            _event_registry['on_join'] += (_stamp(func),)
             return func
         return decorator
 
@@ -266,7 +491,7 @@ class Bot:
         @return: The decorator function.
         """
         def decorator(func: Callable):
-            _event_registry['on_leave'].append(func)
+            _event_registry['on_leave'] += (_stamp(func),)
             return func
         return decorator
 
@@ -279,19 +504,27 @@ class Bot:
         @return: The decorator function.
         """
         def decorator(func: Callable):
-            _event_registry['on_nick'].append(func)
+            _event_registry['on_nick'] += (_stamp(func),)
             return func
         return decorator
 
     @staticmethod
-    def on_raw():
+    def on_raw(contains: Union[str, Tuple[str, ...], None] = None):
         """
         Decorator to register a function to be called for every single raw line received from the server.
         The decorated function must accept one argument: a Context object.
+        @kwarg contains: Only call the function for lines containing this substring, or at least one of these substrings. Called for every line if None. (default: None)
         @return: The decorator function.
+        >>> @Bot.on_raw(contains=("ERROR", "NOTICE"))
+        >>> async def important_lines(ctx):
+        >>>     print(ctx.full_line)
         """
+        substrings = (contains,) if isinstance(contains, str) else contains
+
         def decorator(func: Callable):
-            _event_registry['on_raw'].append(func)
+            if substrings:
+                func.raw_filter = re.compile("|".join(map(re.escape, substrings))).search #type: ignore
+            _event_registry['on_raw'] += (_stamp(func),)
             return func
         return decorator
 
@@ -305,7 +538,7 @@ class Bot:
         def decorator(func: Callable):
             if not asyncio.iscoroutinefunction(func):
                 raise TypeError("@Bot.on_ready function must be an async function.")
-            _event_registry['on_ready'].append(func)
+            _event_registry['on_ready'] += (_stamp(func),)
             return func
         return decorator
 
@@ -323,7 +556,7 @@ class Bot:
             func.interval = interval #type: ignore
             func.max_repeat = max_repeat #type: ignore
             func.current_repeat = 0 #type: ignore
-            _task_registry[func.__name__] = func
+            _task_registry[func.__name__] = _stamp(func)
             return func
         return decorator
 
@@ -343,7 +576,7 @@ class Bot:
         @arg message: The message content.
         @return: None
         """
-        await self.conn.send_raw(f"PRIVMSG {target} :{message}")
+        await self.conn.send_clean(f"PRIVMSG {target} :{message.rstrip()}")
 
     async def send_raw(self, message: str):
         """
@@ -359,7 +592,21 @@ class Bot:
         @arg nick: The nickname to look up.
         @return: A Member object.
         """
-        return Member(self, nick)
+        member = self._member_cache.get(nick)
+        if member is None:
+            member = self._member_cache[nick] = Member(self, nick)
+        return member
+
+    def get_channel(self, name: str) -> Channel:
+        """
+        Returns a Channel object for a given channel name.
+        @arg name: The channel name (e.g., '#general').
+        @return: A Channel object.
+        """
+        channel = self._channel_cache.get(name)
+        if channel is None:
+            channel = self._channel_cache[name] = Channel(self, name)
+        return channel
 
     def load_cog(self, cog_name: str):
         """
@@ -377,55 +624,11 @@ class Bot:
             return [1, False]
 
         self.logger.info("COG", LOG_CORE_COG_LOAD, cog_name=cog_name)
-        before_cmds = set(_command_registry.keys())
-        before_prefix = set(_prefix_command_registry.keys())
-        before_tasks = set(_task_registry.keys())
-        before_events = {key: list(handlers) for key, handlers in _event_registry.items()}
+        start_seq = _registry_seq
 
         try:
             module = importlib.import_module(cog_name)
-            after_cmds = set(_command_registry.keys())
-            new_cmds = after_cmds - before_cmds
-            for cmd in new_cmds:
-                self.commands[cmd] = _command_registry[cmd]
-            after_prefix = set(_prefix_command_registry.keys())
-            new_prefix = after_prefix - before_prefix
-            for prefix in new_prefix:
-                self.prefix_commands[prefix] = _prefix_command_registry[prefix]
-            after_tasks = set(_task_registry.keys())
-            new_tasks = after_tasks - before_tasks
-            for task in new_tasks:
-                self.task_registry[task] = _task_registry[task]
-            new_events_map: Dict[str, List[Callable]] = {}
-            for event_name, after_handlers in _event_registry.items():
-                before_handler_set = set(before_events.get(event_name, []))
-                added_handlers = [h for h in after_handlers if h not in before_handler_set]
-
-                if added_handlers:
-                    new_events_map[event_name] = added_handlers
-                    if event_name not in self.event_handlers:
-                        self.event_handlers[event_name] = []
-                    for added_handlers_items in added_handlers:
-                        self.event_handlers[event_name].append(added_handlers_items)
-
-            self.cogs[cog_name] = {
-                'module': module,
-                'commands': new_cmds,
-                'prefix_commands': new_prefix,
-                'tasks': new_tasks,
-                'events': new_events_map
-            }
-
-            for e_name, handlers in self.event_handlers.items():
-                self.event_handlers[e_name]= []
-            for e_name, handlers in before_events.items():
-                for handler in handlers:
-                    if not handler.__name__ in [h.__name__ for h in self.event_handlers[e_name]]:
-                        self.event_handlers[e_name].append(handler)
-            for e_name, handlers in new_events_map.items():
-                for handler in handlers:
-                    if not handler.__name__ in [h.__name__ for h in self.event_handlers[e_name]]:
-                        self.event_handlers[e_name].append(handler)
+            self.cogs[cog_name] = self._adopt_registrations(module, start_seq)
 
             self.logger.info("COG", LOG_CORE_COG_LOAD_SUCCESS, cog_name=cog_name)
             return [0, True]
@@ -454,39 +657,11 @@ class Bot:
         cog_data = self.cogs.pop(cog_name)
 
         try:
-            for cmd in cog_data['commands']:
-                self.commands.pop(cmd, None)
-                _command_registry.pop(cmd, None)
-
-            for prefix in cog_data['prefix_commands']:
-                self.prefix_commands.pop(prefix, None)
-                _prefix_command_registry.pop(prefix, None)
-
-            for task in cog_data['tasks']:
-                self.task_registry.pop(task, None)
-                _task_registry.pop(task, None)
-
-            for event_name, handlers_to_remove in cog_data['events'].items():
-                for handler in handlers_to_remove:
-                    if event_name in self.event_handlers and handler in self.event_handlers[event_name]:
-                        self.event_handlers[event_name].remove(handler)
-                    if event_name in _event_registry and handler in _event_registry[event_name]:
-                        _event_registry[event_name].remove(handler)
+            self._drop_registrations(cog_data)
 
             if cog_name in sys.modules:
                 del sys.modules[cog_name]
 
-            cogs_copy= self.cogs.copy()
-            self.cogs.clear()
-            for cog_name_l, cog_dispatches in cogs_copy.items():
-                if not cog_name_l == cog_name:
-                    self.cogs[cog_name_l]= cog_dispatches
-            for e_name, _ in _event_registry.items():
-                if e_name in self.event_handlers:
-                    _event_registry[e_name]= self.event_handlers[e_name]
-                else:
-                    _event_registry[e_name]= []
-
             self.logger.info("COG", LOG_CORE_COG_UNLOAD_SUCCESS, cog_name=cog_name)
             return [0, True]
 
@@ -513,63 +688,11 @@ class Bot:
         cog_data = self.cogs.pop(cog_name)
 
         try:
-            for cmd in cog_data['commands']:
-                self.commands.pop(cmd, None)
-                _command_registry.pop(cmd, None)
-
-            for prefix in cog_data['prefix_commands']:
-                self.prefix_commands.pop(prefix, None)
-                _prefix_command_registry.pop(prefix, None)
-
-            for task in cog_data['tasks']:
-                self.task_registry.pop(task, None)
-                _task_registry.pop(task, None)
-
-            for event_name, handlers_to_remove in cog_data['events'].items():
-                for handler in handlers_to_remove:
-                    if event_name in self.event_handlers and handler in self.event_handlers[event_name]:
-                        self.event_handlers[event_name].remove(handler)
-                    if event_name in _event_registry and handler in _event_registry[event_name]:
-                        _event_registry[event_name].remove(handler)
-
-            before_cmds = set(_command_registry.keys())
-            before_prefix = set(_prefix_command_registry.keys())
-            before_tasks = set(_task_registry.keys())
-            before_events = {key: list(handlers) for key, handlers in _event_registry.items()}
+            self._drop_registrations(cog_data)
 
+            start_seq = _registry_seq
             module = importlib.reload(cog_data['module'])
-            after_cmds = set(_command_registry.keys())
-            new_cmds = after_cmds - before_cmds
-            for cmd in new_cmds:
-                self.commands[cmd] = _command_registry[cmd]
-
-            after_prefix = set(_prefix_command_registry.keys())
-            new_prefix = after_prefix - before_prefix
-            for prefix in new_prefix:
-                self.prefix_commands[prefix] = _prefix_command_registry[prefix]
-
-            after_tasks = set(_task_registry.keys())
-            new_tasks = after_tasks - before_tasks
-            for task in new_tasks:
-                self.task_registry[task] = _task_registry[task]
-
-            new_events_map: Dict[str, List[Callable]] = {}
-            for event_name, after_handlers in _event_registry.items():
-                before_handler_set = set(before_events.get(event_name, []))
-                added_handlers = [h for h in after_handlers if h not in before_handler_set]
-                if added_handlers:
-                    new_events_map[event_name] = added_handlers
-                    if event_name not in self.event_handlers:
-                        self.event_handlers[event_name] = []
-                    self.event_handlers[event_name].extend(added_handlers)
-
-            self.cogs[cog_name] = {
-                'module': module,
-                'commands': new_cmds,
-                'prefix_commands': new_prefix,
-                'tasks': new_tasks,
-                'events': new_events_map
-            }
+            self.cogs[cog_name] = self._adopt_registrations(module, start_seq)
             self.logger.info("COG", LOG_CORE_COG_RELOAD_SUCCESS, cog_name=cog_name)
             return [0, True]
 
@@ -577,15 +700,64 @@ class Bot:
             self.logger.error("ERROR", LOG_CORE_COG_RELOAD_FAIL, cog_name=cog_name, error=e)
             return [2, e]
 
+    def _drop_registrations(self, cog_data: Dict[str, Any]):
+        for cmd in cog_data['commands']:
+            self.commands.pop(cmd, None)
+            _command_registry.pop(cmd, None)
+
+        for prefix in cog_data['prefix_commands']:
+            self.prefix_commands.pop(prefix, None)
+            _prefix_command_registry.pop(prefix, None)
+
+        for task in cog_data['tasks']:
+            self.task_registry.pop(task, None)
+            _task_registry.pop(task, None)
+
+        for event_name, handlers_to_remove in cog_data['events'].items():
+            removed = set(handlers_to_remove)
+            if event_name in self.event_handlers:
+                self.event_handlers[event_name] = tuple(h for h in self.event_handlers[event_name] if h not in removed)
+            if event_name in _event_registry:
+                _event_registry[event_name] = tuple(h for h in _event_registry[event_name] if h not in removed)
+
+    def _adopt_registrations(self, module: Any, start_seq: int) -> Dict[str, Any]:
+        def is_new(func: Callable) -> bool:
+            return getattr(func, '_seq', -1) >= start_seq
+
+        new_cmds = {name: func for name, func in _command_registry.items() if is_new(func)}
+        new_prefix = {prefix: func for prefix, func in _prefix_command_registry.items() if is_new(func)}
+        new_tasks = {name: func for name, func in _task_registry.items() if is_new(func)}
+        self.commands.update(new_cmds)
+        self.prefix_commands.update(new_prefix)
+        self.task_registry.update(new_tasks)
+
+        new_events_map: Dict[str, List[Callable]] = {}
+        for event_name, handlers in _event_registry.items():
+            added_handlers = [h for h in handlers if is_new(h)]
+            if added_handlers:
+                new_events_map[event_name] = added_handlers
+                self.event_handlers[event_name] = self.event_handlers.get(event_name, ()) + tuple(added_handlers)
+
+        return {
+            'module': module,
+            'commands': set(new_cmds),
+            'prefix_commands': set(new_prefix),
+            'tasks': set(new_tasks),
+            'events': new_events_map
+        }
+
     async def _run_task(self, task_func: Callable, args: tuple):
         task_name = task_func.__name__
-        task_func.current_repeat = 0 #type: ignore
+        interval = task_func.interval #type: ignore
+        max_repeat = task_func.max_repeat #type: ignore
+        sleep = asyncio.sleep
         logger = self.conn.logger
-        while self.running and (task_func.max_repeat is None or task_func.current_repeat < task_func.max_repeat): #type: ignore
+        repeat = task_func.current_repeat = 0 #type: ignore
+        while self.running and (max_repeat is None or repeat < max_repeat):
             try:
-                task_func.current_repeat += 1 #type: ignore
+                repeat = task_func.current_repeat = repeat + 1 #type: ignore
                 await task_func(self, *args)
-                await asyncio.sleep(task_func.interval) #type: ignore
+                await sleep(interval)
             except Exception as e:
                 logger.error("TASK", LOG_TASK_ERROR, task_name=task_name, error=e)
                 break
@@ -603,102 +775,210 @@ class Bot:
         if task_func.__name__ not in self.task_registry:
             logger.error("TASK", LOG_TASK_NOT_REGISTERED, task_name=task_func.__name__)
             return
-        asyncio.create_task(self._run_task(task_func, args))
+        self._spawn(self._run_task(task_func, args))
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _prefix_matcher(self) -> Optional[re.Pattern]:
+        # Every mutation of the registry bumps its version; the id covers a reassigned prefix_commands
+        registry = self._prefix_commands
+        key = (id(registry), registry.version)
+        if key != self._prefix_re_key:
+            # Longest prefix first so '>>' wins over '>'
+            prefixes = sorted(registry, key=len, reverse=True)
+            self._prefix_re = re.compile("|".join(map(re.escape, prefixes))) if prefixes else None
+            self._prefix_re_key = key
+        return self._prefix_re
 
     def _parse_line(self, line: str) -> Tuple[str, str, str, str, str]:
-        match = IRC_RE.match(line)
-        if not match:
+        # [:prefix ]command[ params][ :trailing]
+        prefix = ""
+        rest = line
+        if line.startswith(":"):
+            space = line.find(" ")
+            if space > 1:
+                prefix = line[1:space]
+                rest = line[space + 1:]
+
+        head, _, message = rest.partition(" :")
+        params = head.split(None, 2)
+        if not params:
             return ("", "", "", "", line)
 
-        prefix, command, target_part, message = match.groups()
+        command = params[0]
+        author_nick = prefix.partition("!")[0]
 
-        author_nick = ""
-        if prefix and '!' in prefix:
-            author_nick = prefix.split('!')[0]
-        elif prefix:
-            author_nick = prefix
-
-        target_system = message.strip() if message and message.startswith("#") else ""
-        target = target_part.split()[0] if target_part else target_system
-
-        return (prefix or "", command or "", target or "", author_nick or "", message or "")
+        if len(params) > 1:
+            target = params[1]
+        else:
+            target = message.strip() if message.startswith("#") else ""
+
+        return (prefix, command, target, author_nick, message)
+
+    async def _handle_protocol(self, data: bytes) -> bool:
+        # Runs on the undecoded line so PINGs never reach the parser
+        if data.startswith(b":"):
+            data = data.partition(b" ")[2]
+        command, _, token = data.partition(b" ")
+        if command != b"PING":
+            return False
+
+        if token.startswith(b":"):
+            token = token[1:]
+        await self.conn.send_pong(token)
+        self.conn.logger.info("NET", LOG_NET_PONG)
+        return True
+
+    async def _dispatch_raw(self, line: str):
+        handlers = self.event_handlers['on_raw']
+        if not handlers:
+            return
 
-    async def _handle_protocol(self, command: str, message: str):
-        logger = self.conn.logger
-        if command == "PING":
-            await self.conn.send_raw(f"PONG :{message}")
-            logger.info("NET", LOG_NET_PONG)
-            return True
-        return False
+        matched = [h for h in handlers if getattr(h, 'raw_filter', None) is None or h.raw_filter(line)]
+        if matched:
+            await self._run_handlers('on_raw', matched, Context(self, "", "", line, "RAW", line))
 
+    async def _run_handlers(self, event_name: str, handlers, *args: Any):
+        # Handlers of one event are independent, run them concurrently and log failures per handler
+        results = await asyncio.gather(*(handler(*args) for handler in handlers), return_exceptions=True)
+        for handler, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                self.conn.logger.error("ERROR", LOG_EVENT_HANDLER_ERROR, event_name=event_name, handler_name=handler.__name__, error=result)
 
     async def _dispatch_line(self, line: str):
-        raw_ctx = Context(self, "", "", line, "RAW", line)
-        for handler in self.event_handlers['on_raw']:
-            await handler(raw_ctx)
+        await self._dispatch_raw(line)
 
         _, command, target, author_nick, message = self._parse_line(line)
 
-        if await self._handle_protocol(command, message):
+        if command == "PRIVMSG":
+            event_name = None
+            handlers = None
+        else:
+            event_name = _LINE_EVENTS.get(command)
+            if event_name is None or author_nick == self.nick:
+                return
+            handlers = self.event_handlers[event_name]
+            if not handlers:
+                return
+
+        ctx = Context(
+            bot=self,
+            target=target,
+            author=author_nick,
+            message=message,
+            command=command,
+            full_line=line
+        )
+
+        if handlers is None:
+            await self._run_message(ctx)
+        else:
+            await self._run_handlers(event_name, handlers, ctx)
+
+    def _resolve_topic(self, line: str):
+        # <prefix> 332 <nick> <channel> :<topic>  /  <prefix> 331 <nick> <channel> :No topic is set
+        _, command, _, _, message = self._parse_line(line)
+        if command != "332" and command != "331":
             return
+        channel = line.partition(" :")[0].rsplit(" ", 1)[-1]
+        future = self._pending_topics.pop(channel.lower(), None)
+        if future is not None and not future.done():
+            future.set_result(message if command == "332" else "")
+
+    async def _line_worker(self, lines: asyncio.Queue):
+        # Dispatches queued lines one at a time in arrival order, while the read loop stays free
+        # to answer PINGs and topic replies that a waiting handler depends on
+        logger = self.conn.logger
+        while True:
+            item = await lines.get()
+            if item is None:
+                return
 
-        if command in ["PRIVMSG", "JOIN", "PART", "QUIT"]:
-            ctx = Context(
-                bot=self,
-                target=target,
-                author=author_nick,
-                message=message,
-                command=command,
-                full_line=line
-            )
-
-            if command == "PRIVMSG":
-                await self._dispatch_message(ctx)
-            elif command == "JOIN" and author_nick != self.nick:
-                for handler in self.event_handlers['on_join']: await handler(ctx)
-            elif command in ["PART", "QUIT"] and author_nick != self.nick:
-                for handler in self.event_handlers['on_leave']: await handler(ctx)
-            elif command == "NICK" and author_nick != self.nick:
-                for handler in self.event_handlers['on_nick']: await handler(ctx)
+            line, is_protocol = item
+            try:
+                if is_protocol:
+                    await self._dispatch_raw(line)
+                    continue
 
-    async def _dispatch_message(self, ctx: Context):
-        logger = self.conn.logger
+                if not self.registered and " 376 " in line:
 
-        is_command_found = False
+                    self.registered = True
+                    logger.info("NET", LOG_READY_MOTD)
+
+                    await self._on_ready_protocol_setup()
+                    await self._run_on_ready_handlers()
+
+                await self._dispatch_line(line)
+            except Exception as e:
+                logger.error("ERROR", LOG_EVENT_HANDLER_ERROR, event_name="line", handler_name="dispatch", error=e)
+
+    async def _run_message(self, ctx: Context):
+        try:
+            await self._dispatch_message(ctx)
+        except Exception as e:
+            self.conn.logger.error("ERROR", LOG_EVENT_HANDLER_ERROR, event_name="PRIVMSG", handler_name=ctx.command_name or "on_message", error=e)
 
-        if ctx.message.startswith(self.prefix):
-            command_and_args = ctx.message[len(self.prefix):].strip()
+    async def _dispatch_message(self, ctx: Context):
+        log_info = self.conn.logger.info
+        message = ctx.message
+        prefix = self._prefix
 
-            parts = command_and_args.split(maxsplit=1)
-            command = parts[0]
+        is_command_found = False
 
-            if command in self.commands:
+        if message.startswith(prefix):
+            prefix_len = self._prefix_len
+            space = message.find(" ", prefix_len)
+            if space < 0:
+                command = message[prefix_len:].rstrip()
+                arg = ""
+            else:
+                command = message[prefix_len:space]
+                arg = message[space + 1:].strip()
+
+            command_func = self.commands.get(command)
+            if command_func:
                 ctx.command_name = command
-                ctx.arg = parts[1] if len(parts) > 1 else ""
-                ctx.args = ctx.arg.split() if ctx.arg else []
-                logger.info("DISPATCH", LOG_DISPATCH_COMMAND, command_name=f"{self.prefix}{command}")
-                await self.commands[command](ctx)
+                ctx.arg = arg
+                ctx.args = arg.split() if arg else []
+                log_info("DISPATCH", LOG_DISPATCH_COMMAND, command_name=f"{prefix}{command}")
+                await command_func(ctx)
                 is_command_found = True
 
-        for prefix_char, handler in self.prefix_commands.items():
-            if ctx.message.startswith(prefix_char):
-                if prefix_char in self.prefix_commands:
-                    args = ctx.message.split(prefix_char, 1)[1]
-                    parts = args.split(" ")
-
-                    ctx.command_name = prefix_char
-                    ctx.arg = args
-                    ctx.args = parts if ctx.args else []
-                    logger.info("DISPATCH", LOG_DISPATCH_COMMAND, command_name=f"{prefix_char}")
-                    await self.prefix_commands[prefix_char](ctx)
-                    is_command_found = True
+        prefix_re = self._prefix_matcher()
+        prefix_match = prefix_re.match(message) if prefix_re else None
+        handler = self.prefix_commands.get(prefix_match.group()) if prefix_match else None
+        if prefix_match and handler is None:
+            # The pattern is out of date with the registry; rebuild it once and match again rather than drop the message
+            self._prefix_re_key = None
+            prefix_re = self._prefix_matcher()
+            prefix_match = prefix_re.match(message) if prefix_re else None
+            handler = self.prefix_commands.get(prefix_match.group()) if prefix_match else None
+        if prefix_match:
+            prefix_char = prefix_match.group()
+            if handler:
+                args = message[prefix_match.end():]
+                # Read the previous args before arg is reassigned; the lazy split would otherwise see the new arg
+                parts = args.split(" ") if ctx.args else []
+
+                ctx.command_name = prefix_char
+                ctx.arg = args
+                ctx.args = parts
+                log_info("DISPATCH", LOG_DISPATCH_COMMAND, command_name=prefix_char)
+                await handler(ctx)
+                is_command_found = True
 
         if not is_command_found and ctx.target.startswith('#'):
-            for handler in self.event_handlers['on_message']:
-                await handler(ctx)
+            handlers = self.event_handlers['on_message']
+            if handlers:
+                await self._run_handlers('on_message', handlers, ctx)
 
         else:
-            dcc_match = DCC_SEND_REGEX.search(ctx.message)
+            dcc_idx = message.find("DCC SEND ")
+            dcc_match = DCC_SEND_REGEX.match(message, dcc_idx) if dcc_idx != -1 else None
 
             if dcc_match:
                 data = dcc_match.groupdict()
@@ -720,16 +1000,16 @@ class Bot:
 
                 self.logger.info("DCC", LOG_DCC_EVENT_DISPATCH, safe_filename=dcc_file.safe_filename)
                 for handler in self.event_handlers['on_dcc']:
-                    asyncio.create_task(handler(dcc_file))
+                    self._spawn(handler(dcc_file))
 
     async def _run_on_ready_handlers(self):
         logger = self.conn.logger
         logger.info("CORE", LOG_READY_DISPATCH)
-        for handler in self.event_handlers['on_ready']:
-            try:
-                await handler(self)
-            except Exception as e:
-                logger.error("ERROR", LOG_READY_HANDLER_ERROR, handler_name=handler.__name__, error=e)
+        handlers = self.event_handlers['on_ready']
+        results = await asyncio.gather(*(handler(self) for handler in handlers), return_exceptions=True)
+        for handler, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                logger.error("ERROR", LOG_READY_HANDLER_ERROR, handler_name=handler.__name__, error=result)
 
 
     async def _on_ready_protocol_setup(self):
@@ -737,12 +1017,13 @@ class Bot:
         logger.info("CORE", LOG_READY_PROTOCOL)
 
         if self.password:
-            await self.conn.send_raw(f"PRIVMSG NickServ :IDENTIFY {self.password}")
+            self.conn.queue_clean(f"PRIVMSG NickServ :IDENTIFY {self.password}")
 
         for channel, key in self.channel_map.items():
             join_cmd = f"JOIN {channel}"
             if key: join_cmd += f" {key}"
-            await self.conn.send_raw(join_cmd)
+            self.conn.queue_clean(join_cmd)
+        await self.conn.flush()
 
 
     async def start(self, channel_map: Dict[str, Optional[str]]):
@@ -755,6 +1036,12 @@ class Bot:
         """
         logger = self.conn.logger
 
+        try:
+            os.makedirs(self.save_dir)
+            logger.info("CORE", LOG_DOWNLOADS_DIR_INIT, dirname = self.save_dir)
+        except FileExistsError:
+            pass
+
         if not self.conn.connected:
             await self.conn.connect()
             if not self.conn.connected: return
@@ -762,35 +1049,38 @@ class Bot:
         self.running = True
         self.channel_map = channel_map
 
-        if self.password: await self.conn.send_raw(f"PASS {self.password}")
-        await self.conn.send_raw(f"USER {self.username} 0 * :{self.realname}")
-        await self.conn.send_raw(f"NICK {self.nick}")
-
-        await asyncio.sleep(0.5)
+        if self.password: self.conn.queue_clean(f"PASS {self.password}")
+        self.conn.queue_clean(f"USER {self.username} 0 * :{self.realname}")
+        self.conn.queue_clean(f"NICK {self.nick}")
+        await self.conn.flush()
 
         logger.info("CORE", LOG_REGISTRATION_SENT)
-        if not os.path.exists(self.save_dir):
-            os.mkdir(self.save_dir)
-            self.logger.info("CORE", LOG_DOWNLOADS_DIR_INIT, dirname = self.save_dir)
 
-        while self.running and self.conn.connected:
-            line = await self.conn.read_line()
+        lines: asyncio.Queue = asyncio.Queue()
+        worker = self._spawn(self._line_worker(lines))
 
-            if line is None: break
+        while self.running and self.conn.connected:
+            batch = await self.conn.read_raw_lines()
 
-            logger.raw_recv(line)
+            if batch is None: break
 
-            if " 376 " in line and not self.registered:
+            for data in batch:
+                if not self.running: break
 
-                self.registered = True
-                logger.info("NET", LOG_READY_MOTD)
+                is_protocol = await self._handle_protocol(data)
+                line = data.decode('utf-8', errors='ignore')
+                logger.raw_recv(line)
 
-                await self._on_ready_protocol_setup()
-                await self._run_on_ready_handlers()
+                if self._pending_topics and not is_protocol:
+                    self._resolve_topic(line)
 
-            await self._dispatch_line(line)
+                lines.put_nowait((line, is_protocol))
 
         self.running = False
+        lines.put_nowait(None)
+        await worker
+        for task in tuple(self._tasks):
+            task.cancel()
         logger.info("CORE", LOG_LOOP_ENDED)
         await self.conn.close()
         return
@@ -18,6 +18,7 @@ LOG_READY_MOTD = "Received 376 End of MOTD. Initialization starting now."
 LOG_REGISTRATION_SENT = "Bot Registration Sent. Entering Main Network Loop"
 LOG_LOOP_ENDED = "Bot Main Loop Ended. Disconnecting."
 LOG_READY_HANDLER_ERROR = "Error in on_ready handler '{handler_name}': {error}"
+LOG_EVENT_HANDLER_ERROR = "Error in {event_name} handler '{handler_name}': {error}"
 LOG_PREFIX_COMMAND_OVERWRITTEN = "Warning: Prefix command '{prefix}' is being overwritten."
 LOG_DCC_TRANSFER_INITIATED = "TRANSFER INITIATED for {safe_filename} from {sender}"
 LOG_DCC_CONNECT_ESTABLISHED = "Connection established. Receiving file: {safe_filename}"
@@ -1,6 +1,5 @@
-from typing import Optional, Any
-from datetime import datetime
-import sys
+from typing import Optional, Any, TextIO
+import sys, time, queue, threading, weakref
 
 class LogLevel:
     """
@@ -23,6 +22,41 @@ LOG_PREFIX = {
     "COG": "[COG]",
     "PERM": "[PERMISSION]"
 }
+_RAW_PREFIX = LOG_PREFIX["RAW"]
+
+def _noop(*args: Any, **kwargs: Any):
+    pass
+
+def _drain(q: queue.SimpleQueue, log_file: TextIO):
+    # Runs on the logger thread; takes no reference to the Logger so it can still be collected
+    running = True
+
+    while running:
+        batch = []
+        line = q.get()
+        while line is not None:
+            batch.append(line)
+            if len(batch) >= 256:
+                break
+            try: line = q.get_nowait()
+            except queue.Empty: break
+        else:
+            running = False
+
+        if not batch:
+            continue
+
+        try:
+            log_file.write('\n'.join(batch) + '\n')
+            if not running or q.empty():
+                log_file.flush()
+        except Exception:
+            print(f"[LOGGER FILE WRITE ERROR] Failed to write to log file.", file=sys.stderr)
+
+def _shutdown(q: queue.SimpleQueue, thread: threading.Thread, log_file: TextIO):
+    q.put(None)
+    thread.join()
+    log_file.close()
 
 
 class Logger:
@@ -39,36 +73,79 @@ class Logger:
         self.file_path = file_path
         self.min_level = min_level
         self.log_file = None
+        self._ts_second = -1
+        self._ts_text = ""
 
         if self.file_path:
             try:
-                self.log_file = open(self.file_path, 'a', encoding='utf-8', buffering=1)
+                self.log_file = open(self.file_path, 'a', encoding='utf-8', buffering=65536)
             except Exception as e:
                 print(f"[LOGGER INIT ERROR] Could not open log file '{file_path}': {e}", file=sys.stderr)
                 self.file_path = None
 
+        # File writes are batched on a daemon thread so disk I/O never blocks the event loop.
+        # Console output stays synchronous so it keeps its order relative to print() calls elsewhere.
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._finalizer: Optional[weakref.finalize] = None
+        if self.log_file:
+            thread = threading.Thread(target=_drain, args=(self._queue, self.log_file), name="nIRC-logger", daemon=True)
+            thread.start()
+            # Stops the thread and closes the file when the Logger is collected or at interpreter exit
+            self._finalizer = weakref.finalize(self, _shutdown, self._queue, thread, self.log_file)
+
+    def close(self):
+        """
+        Flushes any queued lines to the log file, stops the logger thread and closes the file.
+        This is the explicit shutdown path; it also runs automatically when the Logger is collected or the interpreter exits.
+        @return: None
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+
+    @property
+    def min_level(self) -> int:
+        """
+        The minimum LogLevel required for a message to be processed.
+        @return: The current minimum level.
+        """
+        return self._min_level
+
+    @min_level.setter
+    def min_level(self, value: int):
+        self._min_level = value
+        # raw_recv/raw_send run for every line in and out; when DEBUG is filtered they become plain no-ops
+        if value > LogLevel.DEBUG:
+            self.raw_recv = self.raw_send = _noop
+        else:
+            self.__dict__.pop("raw_recv", None)
+            self.__dict__.pop("raw_send", None)
+
+    def _timestamp(self) -> str:
+        # strftime only runs once per wall-clock second; bursts reuse the cached string
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+            self._ts_second = now
+        return self._ts_text
+
     def _format_message(self, log_constant: str, prefix: str, **kwargs: Any) -> str:
+        timestamp = self._timestamp()
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             message = log_constant.format(**kwargs)
-            return f"{timestamp} {prefix} {message}"
         except Exception as e:
-            return f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} [LOGGER FATAL] Failed to format: {log_constant}. Error: {e}"
-
-    def _write(self, level: int, prefix_key: str, log_constant: str, **kwargs: Any):
-        if level < self.min_level:
-            return
+            return f"{timestamp} [LOGGER FATAL] Failed to format: {log_constant}. Error: {e}"
+        return f"{timestamp} {prefix} {message}"
 
-        prefix = LOG_PREFIX.get(prefix_key, "[UNKNOWN]")
-        formatted_line = self._format_message(log_constant, prefix, **kwargs)
+    def _write(self, prefix_key: str, log_constant: str, **kwargs: Any):
+        # Level filtering happens in the public methods, before any formatting work
+        self._emit(self._format_message(log_constant, LOG_PREFIX.get(prefix_key, "[UNKNOWN]"), **kwargs))
 
+    def _emit(self, formatted_line: str):
         print(formatted_line)
 
-        if self.log_file:
-            try:
-                self.log_file.write(formatted_line + '\n')
-            except Exception:
-                print(f"[LOGGER FILE WRITE ERROR] Failed to write to log file.", file=sys.stderr)
+        finalizer = self._finalizer
+        if finalizer is not None and finalizer.alive:
+            self._queue.put(formatted_line)
 
     def debug(self, prefix_key: str, log_constant: str, **kwargs: Any):
         """
@@ -78,7 +155,9 @@ class Logger:
         @kwarg kwargs: Formatting arguments for the log_constant string.
         @return: None
         """
-        self._write(LogLevel.DEBUG, prefix_key, log_constant, **kwargs)
+        if LogLevel.DEBUG < self._min_level:
+            return
+        self._write(prefix_key, log_constant, **kwargs)
 
     def info(self, prefix_key: str, log_constant: str, **kwargs: Any):
         """
@@ -88,7 +167,9 @@ class Logger:
         @kwarg kwargs: Formatting arguments for the log_constant string.
         @return: None
         """
-        self._write(LogLevel.INFO, prefix_key, log_constant, **kwargs)
+        if LogLevel.INFO < self._min_level:
+            return
+        self._write(prefix_key, log_constant, **kwargs)
 
     def error(self, prefix_key: str, log_constant: str, **kwargs: Any):
         """
@@ -98,7 +179,9 @@ class Logger:
         @kwarg kwargs: Formatting arguments for the log_constant string.
         @return: None
         """
-        self._write(LogLevel.ERROR, prefix_key, log_constant, **kwargs)
+        if LogLevel.ERROR < self._min_level:
+            return
+        self._write(prefix_key, log_constant, **kwargs)
 
     def raw_recv(self, line: str):
         """
@@ -106,8 +189,8 @@ class Logger:
         @arg line: The raw IRC line received.
         @return: None
         """
-        if LogLevel.DEBUG >= self.min_level:
-            self._write(LogLevel.DEBUG, "RAW", "<- {line}", line=line)
+        if LogLevel.DEBUG >= self._min_level:
+            self._emit(self._format_message("<- {line}", _RAW_PREFIX, line=line))
 
     def raw_send(self, message: str):
         """
@@ -115,12 +198,8 @@ class Logger:
         @arg message: The raw IRC message being sent.
         @return: None
         """
-        if LogLevel.DEBUG >= self.min_level:
-            self._write(LogLevel.DEBUG, "RAW", "-> {message}", message=message)
-
-    def __del__(self):
-        if self.log_file:
-            self.log_file.close()
+        if LogLevel.DEBUG >= self._min_level:
+            self._emit(self._format_message("-> {message}", _RAW_PREFIX, message=message))
 
 
 class NullLogger:
@@ -1,5 +1,5 @@
-import pickle, os
-from typing import Dict, List
+import json, pickle, os
+from typing import Dict
 
 """
 This verision of Nick management does not manage nicknames however it exists as a login to the perm system
@@ -7,41 +7,50 @@ This verision of Nick management does not manage nicknames however it exists as
 
 class Register:
     def __init__(self):
-        self.db: List[Dict[str, str]]= []
-        self.db_location= "nirc.db"
+        self.db: Dict[str, str]= {}
+        self.db_location= "nirc.json"
+        self.legacy_db_location= "nirc.db"
         self.load_db()
-        self.save_db()
 
     def load_db(self):
         if os.path.exists(self.db_location):
-            with open(self.db_location, "rb") as file:
-                self.db= pickle.load(file)
+            with open(self.db_location, "r", encoding="utf-8") as file:
+                self.db= json.load(file)
+            return
+
+        # One-time migration from the pickle database used by earlier versions
+        if os.path.exists(self.legacy_db_location):
+            with open(self.legacy_db_location, "rb") as file:
+                db= pickle.load(file)
+
+            # Older databases stored a list of single-entry dicts; the first entry for a name wins
+            if isinstance(db, list):
+                flat_db: Dict[str, str]= {}
+                for entry in db:
+                    for username, password in entry.items():
+                        flat_db.setdefault(username, password)
+                db= flat_db
+            self.db= db
+            self.save_db()
 
     def save_db(self):
-        with open(self.db_location, "wb") as file:
-            pickle.dump(self.db, file)
+        tmp_location= self.db_location + ".tmp"
+        with open(tmp_location, "w", encoding="utf-8") as file:
+            json.dump(self.db, file)
+        os.replace(tmp_location, self.db_location)
 
     def get_db(self):
         return self.db
 
     def login(self, username: str, password: str):
-        logged_in= False
-        for entry in self.db:
-            if username in entry and entry[username]== password:
-                logged_in= True
-        return logged_in
+        return username in self.db and self.db[username]== password
 
     def register(self, username: str, password: str):
-        for entry in self.db:
-            if username in entry:
-                return
-        self.db.append({username: password})
+        if username in self.db:
+            return
+        self.db[username]= password
         self.save_db()
 
     def delete_acc(self, username: str):
-        old_db= self.db.copy()
-        self.db.clear()
-        for entry in old_db:
-            if not username in entry:
-                self.db.append(entry)
+        self.db.pop(username, None)
         self.save_db()
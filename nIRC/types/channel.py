@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
+import asyncio
 if TYPE_CHECKING:
     from nIRC.irc import Bot
 
@@ -21,20 +22,30 @@ class Channel:
         Requests OPER for the current channel
         @return: None
         """
-        await self.bot.send_raw(f"MODE {self.name} +o {self.bot.nick}")
+        await self.bot.conn.send_clean(f"MODE {self.name} +o {self.bot.nick}")
 
-    async def get_topic(self) -> str:
-        """
-        Requests the current topic of the channel from the server.
-        Note: The actual topic retrieval is complex and requires waiting for a 332 numeric.
-        This is a placeholder that sends the request and returns an empty string immediately.
-        @return: The current topic of the channel or an empty string in case of failure.
-        """
-        await self.bot.conn.send_raw(f"TOPIC {self.name}")
-        topic_line= await self.bot.conn.read_line() or ""
-        if self.bot.nick in topic_line and self.name in topic_line:
-            return topic_line.split(":", 2)[2]
-        return ""
+    async def get_topic(self, timeout: float = 5) -> str:
+        """
+        Requests the current topic of the channel from the server and waits for the 332 (or 331) reply.
+        The reply is picked up by the bot's read loop, so the bot must be running.
+        @kwarg timeout: Seconds to wait for the server's reply. (default: 5)
+        @return: The current topic of the channel or an empty string if there is none or the request timed out.
+        """
+        pending = self.bot._pending_topics
+        key = self.name.lower()
+        future = pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            pending[key] = future
+            await self.bot.conn.send_clean(f"TOPIC {self.name}")
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return ""
+        finally:
+            if pending.get(key) is future:
+                del pending[key]
 
     async def set_topic(self, new_topic: str):
         """
@@ -42,7 +53,7 @@ class Channel:
         @arg new_topic: The new topic string.
         @return: None
         """
-        await self.bot.conn.send_raw(f"TOPIC {self.name} :{new_topic}")
+        await self.bot.conn.send_clean(f"TOPIC {self.name} :{new_topic.rstrip()}")
 
     async def unban(self, user_mask: str):
         """
@@ -50,4 +61,19 @@ class Channel:
         @arg user_mask: The mask of the user to unban (e.g., 'nick!user@host').
         @return: None
         """
-        await self.bot.conn.send_raw(f"MODE {self.name} -b {user_mask}")
+        await self.bot.conn.send_clean(f"MODE {self.name} -b {user_mask.rstrip()}")
+
+    async def mute_many(self, nicks: Iterable[str], modes_per_line: int = 4):
+        """
+        Mutes several members (sets -v mode) in this channel, grouping them into as few MODE lines as possible.
+        @arg nicks: The nicknames to mute.
+        @kwarg modes_per_line: The maximum number of mode changes per MODE line; most servers accept 4. (default: 4)
+        @return: None
+        """
+        nicks = list(nicks)
+        conn = self.bot.conn
+        for i in range(0, len(nicks), modes_per_line):
+            chunk = nicks[i:i + modes_per_line]
+            conn.queue_clean(f"MODE {self.name} -{'v' * len(chunk)} {' '.join(chunk)}")
+        await conn.flush()
+        self.bot._mute_status.setdefault(self.name, set()).update(nicks)
@@ -1,6 +1,7 @@
 from nIRC.types.member import Member
 from nIRC.types.channel import Channel
 from typing import Optional, List, TYPE_CHECKING
+from functools import cached_property
 
 if TYPE_CHECKING:
     from nIRC.irc import Bot
@@ -30,8 +31,24 @@ class Context:
         self.command_type = command
 
         self.command_name: Optional[str] = None
-        self.arg: str = message.strip()
-        self.args: List[str] = self.arg.split() if self.arg else []
+
+    # arg/args are only split on first access; command dispatch assigns them directly
+    @cached_property
+    def arg(self) -> str:
+        """
+        The message content with surrounding whitespace removed (the command arguments once a command is dispatched).
+        @return: The argument string.
+        """
+        return self.message.strip()
+
+    @cached_property
+    def args(self) -> List[str]:
+        """
+        The whitespace-separated words of arg.
+        @return: A list of argument strings.
+        """
+        arg = self.arg
+        return arg.split() if arg else []
 
     async def reply(self, text: str):
         """
@@ -52,7 +69,7 @@ class Context:
         """
         await self.reply(text)
 
-    @property
+    @cached_property
     def author_obj(self) -> Member:
         """
         Returns a Member object for the message author.
@@ -60,13 +77,13 @@ class Context:
         """
         return self.bot.get_member(self.author)
 
-    @property
+    @cached_property
     def channel_obj(self) -> Channel:
         """
         Returns a Channel object for the message target (only valid for channel messages).
         @return: A Channel object.
         """
-        return Channel(self.bot, self.target)
+        return self.bot.get_channel(self.target)
 
     def get_member(self, nick: str) -> Member:
         """
@@ -74,7 +91,7 @@ class Context:
         @arg nick: The nickname of the member to retrieve.
         @return: A Member object.
         """
-        return Member(self.bot, nick)
+        return self.bot.get_member(nick)
 
     async def unban(self, target_user: str):
         """
@@ -4,6 +4,8 @@ import os
 import struct
 import asyncio
 
+_ACK = struct.Struct("!I")
+
 class DCCFile:
     """
     Initializes the DCC file object.
@@ -31,11 +33,11 @@ class DCCFile:
         self.progress = 0
         self.percent = 0
 
-    async def start_transfer(self, connect_timeout=10, ack_chunk_size=4096):
+    async def start_transfer(self, connect_timeout=10, ack_chunk_size=65536):
         """
         Starts the transfer process.
         @kwarg connect_timeout: The connection timeout. (default: 10)
-        @kwarg ack_chunk_size: The transfer chunk size. (default: 4096)
+        @kwarg ack_chunk_size: The maximum number of bytes read (and acknowledged) per chunk. (default: 65536)
         @return: None
         """
         self.context.bot.logger.info("DCC", LOG_DCC_TRANSFER_INITIATED, safe_filename=self.safe_filename, sender=self.sender)
@@ -68,32 +70,56 @@ class DCCFile:
         self.is_done = True
 
 
+    async def _finish_write(self, pending_write):
+        # The executor thread cannot be interrupted, so even when this task is cancelled keep waiting
+        # for the write to land before the file is touched again, then re-raise the cancellation
+        cancelled = False
+        while not pending_write.done():
+            try:
+                await asyncio.wait((pending_write,))
+            except asyncio.CancelledError:
+                cancelled = True
+        if cancelled:
+            raise asyncio.CancelledError()
+        pending_write.result()
+
     async def _transfer_loop(self, reader, writer, ack_chunk_size):
         received_bytes = 0
+        loop = asyncio.get_running_loop()
+        # Disk writes run in the default executor; the next chunk is read while the previous one is written
+        pending_write = None
+        progress_step = 1024 * 1024 * 5
+        next_progress = progress_step
 
         try:
             with open(self.full_path, 'wb') as f:
-                while received_bytes < self.filesize:
-                    data = await asyncio.wait_for(
-                        reader.read(ack_chunk_size),
-                        timeout=30
-                    )
-
-                    if not data:
-                        self.context.bot.logger.info("DCC", LOG_DCC_SENDER_CLOSED, received_bytes=received_bytes)
-                        break
-
-                    f.write(data)
-                    received_bytes += len(data)
-
-                    ack_message = struct.pack("!I", received_bytes)
-                    writer.write(ack_message)
-                    await writer.drain()
-
-                    if received_bytes % (1024 * 1024 * 5) == 0 or received_bytes == self.filesize:
-                        percent = (received_bytes / self.filesize) * 100 if self.filesize > 0 else 0
-                        self.context.bot.logger.info("DCC", LOG_DCC_PROGRESS, percent=percent, received_bytes=received_bytes, filesize=self.filesize)
-                        self.progress, self.percent = received_bytes, percent
+                try:
+                    while received_bytes < self.filesize:
+                        data = await asyncio.wait_for(
+                            reader.read(ack_chunk_size),
+                            timeout=30
+                        )
+
+                        if not data:
+                            self.context.bot.logger.info("DCC", LOG_DCC_SENDER_CLOSED, received_bytes=received_bytes)
+                            break
+
+                        if pending_write is not None:
+                            await self._finish_write(pending_write)
+                        pending_write = loop.run_in_executor(None, f.write, data)
+                        received_bytes += len(data)
+
+                        writer.write(_ACK.pack(received_bytes))
+                        await writer.drain()
+
+                        if received_bytes >= next_progress or received_bytes == self.filesize:
+                            next_progress = received_bytes - received_bytes % progress_step + progress_step
+                            percent = (received_bytes / self.filesize) * 100 if self.filesize > 0 else 0
+                            self.context.bot.logger.info("DCC", LOG_DCC_PROGRESS, percent=percent, received_bytes=received_bytes, filesize=self.filesize)
+                            self.progress, self.percent = received_bytes, percent
+                finally:
+                    if pending_write is not None:
+                        await self._finish_write(pending_write)
 
             if received_bytes == self.filesize:
                 self.context.bot.logger.info("DCC", LOG_DCC_SUCCESS, safe_filename=self.safe_filename)
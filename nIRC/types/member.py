@@ -32,7 +32,7 @@ class Member:
         @kwarg reason: The kick message/reason. (default: "Requested by bot")
         @return: None
         """
-        await self.bot.conn.send_raw(f"KICK {channel} {self.nick} :{reason}")
+        await self.bot.conn.send_clean(f"KICK {channel} {self.nick} :{reason.rstrip()}")
 
     async def ban(self, channel: str, reason: str = "Banned by bot"):
         """
@@ -41,7 +41,7 @@ class Member:
         @kwarg reason: The kick message/reason. (default: "Banned by bot")
         @return: None
         """
-        await self.bot.conn.send_raw(f"MODE {channel} +b {self.nick}!*@*")
+        await self.bot.conn.send_clean(f"MODE {channel} +b {self.nick}!*@*")
         await self.kick(channel, reason)
 
     async def mute(self, channel: str):
@@ -50,7 +50,7 @@ class Member:
         @arg channel: The channel name (e.g., '#main').
         @return: None
         """
-        await self.bot.conn.send_raw(f"MODE {channel} -v {self.nick}")
+        await self.bot.conn.send_clean(f"MODE {channel} -v {self.nick}")
         self.bot._mute_status.setdefault(channel, set()).add(self.nick)
 
     async def unmute(self, channel: str):
@@ -59,7 +59,7 @@ class Member:
         @arg channel: The channel name (e.g., '#main').
         @return: None
         """
-        await self.bot.conn.send_raw(f"MODE {channel} +v {self.nick}")
+        await self.bot.conn.send_clean(f"MODE {channel} +v {self.nick}")
         if channel in self.bot._mute_status and self.nick in self.bot._mute_status[channel]:
             self.bot._mute_status[channel].remove(self.nick)
 